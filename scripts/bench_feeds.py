@@ -0,0 +1,129 @@
+import argparse
+import html
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, List
+
+from agentic_ai_kata.utils.feeds import parse_atom, parse_rss
+
+
+def _legacy_clean_text(t: str) -> str:
+    # Previous NewsAgent cleaning path, kept here as the benchmark baseline
+    if not t:
+        return t
+    t = html.unescape(t)
+    t = re.sub(r"<[^>]+>", " ", t)
+    t = re.sub(r"\s+", " ", t)
+    return t.strip()
+
+
+def make_rss(n: int) -> bytes:
+    items = []
+    for i in range(n):
+        items.append(
+            "<item>"
+            f"<title>Company {i} beats estimates as revenue climbs - Outlet {i % 40}</title>"
+            f"<link>https://news.google.com/rss/articles/CBMi{i:08d}?oc=5</link>"
+            f"<guid isPermaLink=\"false\">CBMi{i:08d}</guid>"
+            f"<pubDate>Mon, {1 + i % 28:02d} Sep 2025 {i % 24:02d}:15:00 GMT</pubDate>"
+            f"<description>&lt;a href=\"https://news.google.com/rss/articles/CBMi{i:08d}\"&gt;Company {i} beats estimates&lt;/a&gt;"
+            f"&amp;nbsp;&amp;nbsp;&lt;font color=\"#6f6f6f\"&gt;Outlet {i % 40}&lt;/font&gt;</description>"
+            f"<source url=\"https://outlet{i % 40}.example\">Outlet {i % 40}</source>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        "<title>Google News</title><link>https://news.google.com</link>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def make_atom(n: int) -> bytes:
+    entries = []
+    for i in range(n):
+        entries.append(
+            "<entry>"
+            f"<category label=\"form type\" scheme=\"https://www.sec.gov/\" term=\"10-Q\"/>"
+            f"<content type=\"text/xml\"><accession-number>0000320193-25-{i:06d}</accession-number>"
+            "<filing-type>10-Q</filing-type></content>"
+            f"<id>urn:tag:sec.gov,2008:accession-number=0000320193-25-{i:06d}</id>"
+            f"<link href=\"https://www.sec.gov/Archives/edgar/data/320193/{i:06d}-index.htm\" rel=\"alternate\" type=\"text/html\"/>"
+            f"<summary type=\"html\"> &lt;b&gt;Filed:&lt;/b&gt; 2025-08-01 &lt;b&gt;AccNo:&lt;/b&gt; {i}</summary>"
+            f"<title>10-Q  - Quarterly report [Sections 13 or 15(d)]</title>"
+            f"<updated>2025-08-01T06:01:{i % 60:02d}-04:00</updated>"
+            "</entry>"
+        )
+    return (
+        '<?xml version="1.0" encoding="ISO-8859-1" ?><feed xmlns="http://www.w3.org/2005/Atom">'
+        "<title>Apple Inc. (0000320193)</title>"
+        + "".join(entries)
+        + "</feed>"
+    ).encode("iso-8859-1")
+
+
+def legacy_rss(data: bytes) -> List[Any]:
+    import feedparser
+
+    out = []
+    for e in feedparser.parse(data).entries:
+        published_parsed = getattr(e, "published_parsed", None)
+        out.append((
+            _legacy_clean_text(getattr(e, "title", "")),
+            getattr(e, "link", None),
+            _legacy_clean_text(getattr(getattr(e, "source", {}), "title", "")),
+            datetime(*published_parsed[:6]).isoformat() if published_parsed else None,
+            _legacy_clean_text(getattr(e, "summary", "")),
+        ))
+    return out
+
+
+def legacy_atom(data: bytes) -> List[Any]:
+    from bs4 import BeautifulSoup  # type: ignore
+
+    out = []
+    for e in BeautifulSoup(data, "xml").find_all("entry"):
+        out.append((
+            e.title.get_text(strip=True) if e.title else None,
+            e.link.get("href") if e.link else None,
+            e.updated.get_text(strip=True) if e.updated else None,
+        ))
+    return out
+
+
+def bench(name: str, fn: Callable[[bytes], List[Any]], data: bytes, repeat: int) -> float:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(fn(data))
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<28} {best * 1000:9.1f} ms  ({count} records)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark streaming feed parsing vs feedparser/BeautifulSoup")
+    parser.add_argument("--items", type=int, default=10000, help="Entries per synthetic feed (default 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser; best time is reported")
+    args = parser.parse_args()
+
+    rss = make_rss(args.items)
+    print(f"RSS ({len(rss) / 1e6:.1f} MB, {args.items} items)")
+    new = bench("parse_rss (lxml iterparse)", parse_rss, rss, args.repeat)
+    try:
+        old = bench("feedparser + _clean_text", legacy_rss, rss, args.repeat)
+        print(f"  speedup: {old / new:.1f}x")
+    except ImportError:
+        print("  feedparser not installed; skipping baseline")
+
+    atom = make_atom(args.items)
+    print(f"Atom ({len(atom) / 1e6:.1f} MB, {args.items} entries)")
+    new = bench("parse_atom (lxml iterparse)", parse_atom, atom, args.repeat)
+    old = bench("BeautifulSoup 'xml'", legacy_atom, atom, args.repeat)
+    print(f"  speedup: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from agentic_ai_kata import records
+from agentic_ai_kata.records import (
+    Filing,
+    Financials,
+    Fundamentals,
+    Identity,
+    NewsCluster,
+    NewsItem,
+    Price,
+    Valuation,
+)
+
+
+def make_records(n: int) -> Tuple[List[Fundamentals], List[NewsItem], List[NewsCluster], List[Filing]]:
+    fundamentals = [
+        Fundamentals(
+            ticker=f"T{i}",
+            identity=Identity(name=f"Company {i}", sector="Technology", industry="Consumer Electronics", exchange="NMS"),
+            price=Price(last=100.0 + i, currency="USD"),
+            valuation=Valuation(market_cap=1e9 + i, trailing_pe=25.1, forward_pe=22.3, price_to_book=8.4),
+            financials=Financials(revenue=3.9e11, net_income=9.4e10, free_cash_flow=1.1e11),
+            raw_info_available=True,
+        )
+        for i in range(n)
+    ]
+    news = [
+        NewsItem(
+            title=f"Company {i} beats estimates as revenue climbs",
+            source=f"Outlet {i % 40}",
+            published="2025-09-01T00:15:00",
+            link=f"https://news.google.com/rss/articles/CBMi{i:08d}",
+            summary=f"Company {i} reported quarterly results ahead of expectations.",
+        )
+        for i in range(n)
+    ]
+    clusters = [NewsCluster(title=news[i].title or "", size=1, summary=None, items=[news[i]]) for i in range(n)]
+    filings = [
+        Filing(
+            title="10-Q - Quarterly report",
+            filing_page=f"https://www.sec.gov/Archives/edgar/data/320193/{i:06d}-index.htm",
+            primary_doc=f"https://www.sec.gov/Archives/edgar/data/320193/{i:06d}.htm",
+            updated="2025-08-01T06:01:00-04:00",
+            sections={"Business": "ITEM 1. BUSINESS ...", "Risk Factors": "ITEM 1A. RISK FACTORS ..."},
+            summary="Quarterly results ...",
+        )
+        for i in range(n)
+    ]
+    return fundamentals, news, clusters, filings
+
+
+def to_shared_dicts(groups: Any) -> List[Any]:
+    # Mirror the record graph: clusters reference the same news dicts as the news list
+    memo: Dict[int, Dict[str, Any]] = {}
+
+    def conv(r: Any) -> Any:
+        if isinstance(r, NewsItem):
+            if id(r) not in memo:
+                memo[id(r)] = r.to_dict()
+            return memo[id(r)]
+        if isinstance(r, NewsCluster):
+            return {"title": r.title, "size": r.size, "summary": r.summary, "items": [conv(m) for m in r.items]}
+        return r.to_dict()
+
+    return [[conv(r) for r in group] for group in groups]
+
+
+def measure(build: Callable[[], Any]) -> Tuple[Any, int]:
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def bench(name: str, fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    out: Any = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<34} {best * 1000:9.1f} ms  ({len(out) / 1e6:.1f} MB)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Memory and serialization benchmark for result records")
+    parser.add_argument("--records", type=int, default=10000, help="Records per type (default 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per encoder; best time is reported")
+    args = parser.parse_args()
+
+    # Both measurements include the field strings; the temporary records behind the dicts are freed
+    as_records, rec_bytes = measure(lambda: make_records(args.records))
+    as_dicts, dict_bytes = measure(lambda: to_shared_dicts(make_records(args.records)))
+    print(f"Memory ({args.records} fundamentals + news items + clusters + filings)")
+    print(f"  dicts                              {dict_bytes / 1e6:9.1f} MB")
+    print(f"  slotted records                    {rec_bytes / 1e6:9.1f} MB  ({dict_bytes / rec_bytes:.1f}x smaller)")
+
+    payload = {"fundamentals": as_records[0], "news": as_records[1], "news_clusters": as_records[2], "filings": as_records[3]}
+    dict_payload = dict(zip(payload, as_dicts))
+    print("Serialization")
+    old = bench("json.dumps(dicts, indent=2)", lambda: json.dumps(dict_payload, indent=2, ensure_ascii=False), args.repeat)
+    new = bench(f"records.dumps ({'orjson' if records.orjson else 'json'})", lambda: records.dumps(payload, indent=True), args.repeat)
+    print(f"  speedup: {old / new:.1f}x")
+    if records.msgpack is not None:
+        bench("records.dumps_msgpack", lambda: records.dumps_msgpack(payload), args.repeat)
+    else:
+        print("  msgpack not installed; skipping MessagePack")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from agentic_ai_kata.agents.news_agent import NewsAgent
 from agentic_ai_kata.agents.filings_agent import FilingsAgent
 from agentic_ai_kata.utils.ollama_client import OllamaClient
 from agentic_ai_kata.utils.cluster import cluster_news
+from agentic_ai_kata.records import NewsCluster
 
 def heartbeat_printer(beat: Dict[str, Any]) -> None:
     print(f"[heartbeat] {beat}")
@@ -59,12 +60,12 @@ async def main():
             for c in clusters:
                 titles = ". ".join([(i.get("title") or "") for i in c.get("items", [])])[:1000]
                 s = summarizer(titles) if titles else None
-                summaries.append({
-                    "title": c.get("title"),
-                    "size": len(c.get("items", [])),
-                    "summary": s,
-                    "items": c.get("items", [])
-                })
+                summaries.append(NewsCluster(
+                    title=c.title,
+                    size=c.size,
+                    summary=s,
+                    items=c.items,
+                ))
             results["news_clusters"] = summaries
         else:
             results["news_clusters"] = clusters
@@ -0,0 +1,64 @@
+import argparse
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, List
+
+from agentic_ai_kata.scheduler import WatchlistScheduler
+
+
+def result_printer(ticker: str, agent: str, result: Any) -> None:
+    err = result.get("error") if isinstance(result, Mapping) else None
+    print(f"[refresh] {ticker} {agent}: {'OK' if not err else 'ERROR: ' + str(err)}")
+
+
+def parse_budgets(specs: List[str]) -> Dict[str, float]:
+    budgets: Dict[str, float] = {}
+    for spec in specs:
+        src, sep, rpm = spec.partition("=")
+        if not sep:
+            raise ValueError(f"expected src=rpm, got {spec!r}")
+        budgets[src.strip()] = float(rpm)
+    return budgets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Keep a watchlist fresh with staleness-based scheduling")
+    parser.add_argument("--tickers", required=True, help="Comma-separated tickers, e.g. AAPL,MSFT,TSLA")
+    parser.add_argument("--agents", default="fundamentals,news,filings", help="Comma-separated agents to refresh")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--filings-limit", type=int, default=2)
+    parser.add_argument(
+        "--source-budget",
+        action="append",
+        default=[],
+        metavar="SRC=RPM",
+        help="Requests per minute for a source (yahoo, google_news, sec); repeatable, e.g. --source-budget sec=20",
+    )
+    parser.add_argument("--llm-tpm", type=float, default=0.0, help="LLM tokens-per-minute budget for summaries (0 disables)")
+    parser.add_argument("--ollama-model", default="mistral:latest")
+    parser.add_argument("--ollama-url", default="http://localhost:11434")
+    args = parser.parse_args()
+
+    try:
+        sched = WatchlistScheduler(
+            [t.strip() for t in args.tickers.split(",") if t.strip()],
+            agents=[a.strip() for a in args.agents.split(",") if a.strip()],
+            source_budgets=parse_budgets(args.source_budget),
+            llm_tokens_per_minute=args.llm_tpm,
+            ollama_model=args.ollama_model,
+            ollama_url=args.ollama_url,
+            days=args.days,
+            filings_limit=args.filings_limit,
+            on_result=result_printer,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    stop = threading.Event()
+    try:
+        sched.run_forever(stop=stop)
+    except KeyboardInterrupt:
+        stop.set()
+
+
+if __name__ == "__main__":
+    main()
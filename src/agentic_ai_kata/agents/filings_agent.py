@@ -1,8 +1,10 @@
 import re
-from typing import Any, Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 from bs4 import BeautifulSoup  # type: ignore
 
+from ..records import Filing, Filings
+from ..utils.feeds import parse_atom
 from ..utils.http import HttpClient
 from ..utils.ollama_client import OllamaClient
 
@@ -16,14 +18,14 @@ class FilingsAgent:
     def __init__(self, http: Optional[HttpClient] = None) -> None:
         self.http = http or HttpClient(user_agent="AgenticAIKata/1.0 (contact: local dev)")
 
-    def _sec_feed(self, ticker: str, limit: int) -> Optional[str]:
+    def _sec_feed(self, ticker: str, limit: int) -> Optional[bytes]:
         # Use SEC browse endpoint with output=atom and type filter
         url = (
             "https://www.sec.gov/cgi-bin/browse-edgar?action=getcompany"
             f"&CIK={ticker}&type=10-%25&owner=exclude&count={limit}&output=atom"
         )
         r = self.http.get(url, headers={"Accept": "application/atom+xml"}, retries=2)
-        return r.text if r is not None else None
+        return r.content if r is not None else None
 
     def _extract_primary_doc_url(self, filing_page_url: str) -> Optional[str]:
         # Filing detail page contains a table of documents. Pick the first HTML/TXT document.
@@ -81,21 +83,31 @@ class FilingsAgent:
             sections[name] = snippet[:5000]
         return sections
 
-    def fetch(self, ticker: str, limit: int = 2, summarize: bool = False, ollama_model: str = "mistral:latest", ollama_url: str = "http://localhost:11434") -> Dict[str, Any]:
+    def fetch(
+        self,
+        ticker: str,
+        limit: int = 2,
+        summarize: bool = False,
+        ollama_model: str = "mistral:latest",
+        ollama_url: str = "http://localhost:11434",
+        summarizer: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> Filings:
+        """
+        `summarizer`, if given, is called with the full prompt for each filing instead of the
+        built-in Ollama client; when it returns None the extractive baseline is kept.
+        """
         feed_xml = self._sec_feed(ticker, limit)
         if not feed_xml:
-            return {"ticker": ticker.upper(), "filings": [], "error": "no_feed"}
+            return Filings(ticker=ticker.upper(), filings=[], error="no_feed")
 
-        soup = BeautifulSoup(feed_xml, "xml")
-        entries = soup.find_all("entry")
-        filings: List[Dict[str, Any]] = []
-        client = OllamaClient(base_url=ollama_url) if summarize else None
+        entries = parse_atom(feed_xml)
+        filings: List[Filing] = []
+        client = OllamaClient(base_url=ollama_url) if summarize and summarizer is None else None
 
         for e in entries:
-            title = e.title.get_text(strip=True) if e.title else None
-            link_tag = e.link
-            filing_url = link_tag.get("href") if link_tag else None
-            updated = e.updated.get_text(strip=True) if e.updated else None
+            title = e.title
+            filing_url = e.link
+            updated = e.updated
 
             sections: Dict[str, str] = {}
             summary: Optional[str] = None
@@ -109,24 +121,29 @@ class FilingsAgent:
                         sections = self._extract_sections(cleaned)
                         # Build a short extractive summary baseline
                         baseline = cleaned[:800]
-                        if summarize and client:
-                            prompt = (
-                                "Summarize the key points of this SEC filing excerpt (10-K/10-Q) in 3-5 concise bullets, "
-                                "focusing on business overview, major risks, and financial highlights.\n\n" + baseline
-                            )
+                        prompt = (
+                            "Summarize the key points of this SEC filing excerpt (10-K/10-Q) in 3-5 concise bullets, "
+                            "focusing on business overview, major risks, and financial highlights.\n\n" + baseline
+                        )
+                        if summarizer is not None:
+                            try:
+                                summary = summarizer(prompt) or baseline
+                            except Exception:
+                                summary = baseline
+                        elif summarize and client:
                             summary = client.generate(prompt, model=ollama_model) or None
                         else:
                             summary = baseline
 
             filings.append(
-                {
-                    "title": title,
-                    "filing_page": filing_url,
-                    "primary_doc": primary if filing_url else None,
-                    "updated": updated,
-                    "sections": sections,
-                    "summary": summary,
-                }
+                Filing(
+                    title=title,
+                    filing_page=filing_url,
+                    primary_doc=primary if filing_url else None,
+                    updated=updated,
+                    sections=sections,
+                    summary=summary,
+                )
             )
 
-        return {"ticker": ticker.upper(), "filings": filings}
+        return Filings(ticker=ticker.upper(), filings=filings, error=None)
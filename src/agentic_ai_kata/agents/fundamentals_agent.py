@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional
 import pandas as pd
 import yfinance as yf
 
+from ..records import Financials, Fundamentals, Identity, Price, Valuation
+
 
 class FundamentalsAgent:
     """
@@ -29,7 +31,7 @@ class FundamentalsAgent:
         except Exception:
             return None
 
-    def fetch(self, ticker: str) -> Dict[str, Any]:
+    def fetch(self, ticker: str) -> Fundamentals:
         t = yf.Ticker(ticker)
 
         # Prefer get_info (yfinance >= 0.2.40) but fall back gracefully
@@ -89,28 +91,28 @@ class FundamentalsAgent:
         except Exception:
             pass
 
-        return {
-            "ticker": ticker.upper(),
-            "identity": {
-                "name": long_name,
-                "sector": sector,
-                "industry": industry,
-                "exchange": exchange,
-            },
-            "price": {
-                "last": last_price,
-                "currency": currency,
-            },
-            "valuation": {
-                "market_cap": market_cap,
-                "trailing_pe": trailing_pe,
-                "forward_pe": forward_pe,
-                "price_to_book": price_to_book,
-            },
-            "financials": {
-                "revenue": revenue,
-                "net_income": net_income,
-                "free_cash_flow": free_cash_flow,
-            },
-            "raw_info_available": bool(info),
-        }
+        return Fundamentals(
+            ticker=ticker.upper(),
+            identity=Identity(
+                name=long_name,
+                sector=sector,
+                industry=industry,
+                exchange=exchange,
+            ),
+            price=Price(
+                last=last_price,
+                currency=currency,
+            ),
+            valuation=Valuation(
+                market_cap=market_cap,
+                trailing_pe=trailing_pe,
+                forward_pe=forward_pe,
+                price_to_book=price_to_book,
+            ),
+            financials=Financials(
+                revenue=revenue,
+                net_income=net_income,
+                free_cash_flow=free_cash_flow,
+            ),
+            raw_info_available=bool(info),
+        )
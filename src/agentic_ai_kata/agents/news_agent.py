@@ -1,19 +1,10 @@
-from datetime import datetime
-import html
-import re
-from typing import Any, Dict, List, Optional, Callable
+from typing import List, Optional, Callable
 
-import feedparser
 from urllib.parse import quote_plus
 
-
-def _clean_text(t: str) -> str:
-    if not t:
-        return t
-    t = html.unescape(t)
-    t = re.sub(r"<[^>]+>", " ", t)
-    t = re.sub(r"\s+", " ", t)
-    return t.strip()
+from ..records import NewsItem
+from ..utils.feeds import parse_rss
+from ..utils.http import HttpClient
 
 
 class NewsAgent:
@@ -22,6 +13,9 @@ class NewsAgent:
     No API keys required.
     """
 
+    def __init__(self, http: Optional[HttpClient] = None) -> None:
+        self.http = http or HttpClient()
+
     def _build_query(self, ticker: str, company_name: Optional[str]) -> str:
         if company_name:
             # Use OR to broaden recall, quoted name to improve precision
@@ -35,30 +29,25 @@ class NewsAgent:
         days: int = 7,
         max_items: int = 15,
         summarizer: Optional[Callable[[str], Optional[str]]] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[NewsItem]:
         query = self._build_query(ticker, company_name)
         qparam = quote_plus(query)
         url = (
             "https://news.google.com/rss/search?"
             f"q={qparam}+when:{days}d&hl=en-US&gl=US&ceid=US:en"
         )
-        feed = feedparser.parse(url)
-        items: List[Dict[str, Any]] = []
+        r = self.http.get(url, headers={"Accept": "application/rss+xml"}, retries=1)
+        items: List[NewsItem] = []
+        if r is None:
+            return items
 
-        for e in feed.entries[:max_items]:
-            title = _clean_text(getattr(e, "title", ""))
-            link = getattr(e, "link", None)
-            summary = _clean_text(getattr(e, "summary", ""))
-            source = _clean_text(getattr(getattr(e, "source", {}), "title", ""))
-            published = getattr(e, "published", None)
-            try:
-                published_parsed = getattr(e, "published_parsed", None)
-                if published_parsed:
-                    published_iso = datetime(*published_parsed[:6]).isoformat()
-                else:
-                    published_iso = None
-            except Exception:
-                published_iso = None
+        for e in parse_rss(r.content, max_items=max_items):
+            title = e.title or ""
+            link = e.link
+            summary = e.summary or ""
+            source = e.source or ""
+            published = e.published
+            published_iso = e.published_iso
 
             concise = summary[:240] + ("…" if len(summary) > 240 else "") if summary else None
 
@@ -74,13 +63,13 @@ class NewsAgent:
                     pass
 
             items.append(
-                {
-                    "title": title or None,
-                    "source": source or None,
-                    "published": published_iso or published,
-                    "link": link,
-                    "summary": concise,
-                }
+                NewsItem(
+                    title=title or None,
+                    source=source or None,
+                    published=published_iso or published,
+                    link=link,
+                    summary=concise,
+                )
             )
 
         return items
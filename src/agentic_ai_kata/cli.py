@@ -1,8 +1,8 @@
 import argparse
-import json
 from typing import Any
 
 from .orchestrator import Orchestrator
+from .records import dumps
 
 
 def main() -> None:
@@ -31,7 +31,7 @@ def main() -> None:
     )
 
     if args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(dumps(result, indent=True))
         return
 
     f = result["fundamentals"]
@@ -5,6 +5,7 @@ from .agents.news_agent import NewsAgent
 from .utils.ollama_client import OllamaClient
 from .agents.filings_agent import FilingsAgent
 from .utils.cluster import cluster_news
+from .records import NewsCluster
 
 
 class Orchestrator:
@@ -54,12 +55,12 @@ class Orchestrator:
                         summary_text = summarizer(basis_text)
                     except Exception:
                         summary_text = None
-                cluster_summaries.append({
-                    "title": title,
-                    "size": len(members),
-                    "summary": summary_text,
-                    "items": members,
-                })
+                cluster_summaries.append(NewsCluster(
+                    title=title,
+                    size=len(members),
+                    summary=summary_text,
+                    items=members,
+                ))
             result["news_clusters"] = cluster_summaries if summarize else clusters
 
         if include_filings:
@@ -0,0 +1,180 @@
+import json
+import math
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
+from typing import Mapping as MappingType
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # optional: MessagePack output
+    msgpack = None
+
+
+class Record(Mapping):
+    """
+    Base for compact agent results: subclasses are dataclasses with explicit __slots__
+    (no per-instance __dict__). The read-only Mapping view keeps `r["key"]`, `r.get(...)`,
+    `dict(r)` and iteration working for code written against the old dict results.
+    Subclasses use eq=False so equality is Mapping's: a record equals dict(record).
+    Use to_dict() (or to_builtin() for containers) before handing results to json.dumps;
+    it returns a JSON-ready copy with numpy scalars unwrapped and NaN/inf mapped to None.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {k: to_builtin(getattr(self, k)) for k in self.__slots__}
+
+
+@dataclass(eq=False)
+class Identity(Record):
+    __slots__ = ("name", "sector", "industry", "exchange")
+    name: Optional[str]
+    sector: Optional[str]
+    industry: Optional[str]
+    exchange: Optional[str]
+
+
+@dataclass(eq=False)
+class Price(Record):
+    __slots__ = ("last", "currency")
+    last: Optional[float]
+    currency: Optional[str]
+
+
+@dataclass(eq=False)
+class Valuation(Record):
+    __slots__ = ("market_cap", "trailing_pe", "forward_pe", "price_to_book")
+    market_cap: Optional[float]
+    trailing_pe: Optional[float]
+    forward_pe: Optional[float]
+    price_to_book: Optional[float]
+
+
+@dataclass(eq=False)
+class Financials(Record):
+    __slots__ = ("revenue", "net_income", "free_cash_flow")
+    revenue: Optional[float]
+    net_income: Optional[float]
+    free_cash_flow: Optional[float]
+
+
+@dataclass(eq=False)
+class Fundamentals(Record):
+    __slots__ = ("ticker", "identity", "price", "valuation", "financials", "raw_info_available")
+    ticker: str
+    identity: Identity
+    price: Price
+    valuation: Valuation
+    financials: Financials
+    raw_info_available: bool
+
+
+@dataclass(eq=False)
+class NewsItem(Record):
+    __slots__ = ("title", "source", "published", "link", "summary")
+    title: Optional[str]
+    source: Optional[str]
+    published: Optional[str]
+    link: Optional[str]
+    summary: Optional[str]
+
+
+@dataclass(eq=False)
+class NewsCluster(Record):
+    __slots__ = ("title", "size", "summary", "items")
+    title: str
+    size: int
+    summary: Optional[str]
+    items: List[MappingType[str, Any]]  # NewsItem records, or any mapping passed to cluster_news
+
+
+@dataclass(eq=False)
+class Filing(Record):
+    __slots__ = ("title", "filing_page", "primary_doc", "updated", "sections", "summary")
+    title: Optional[str]
+    filing_page: Optional[str]
+    primary_doc: Optional[str]
+    updated: Optional[str]
+    sections: Dict[str, str]
+    summary: Optional[str]
+
+
+@dataclass(eq=False)
+class Filings(Record):
+    __slots__ = ("ticker", "filings", "error")
+    ticker: str
+    filings: List[Filing]
+    error: Optional[str]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Record):
+        # Shallow: the encoder recurses into nested records itself
+        return {k: getattr(obj, k) for k in obj.__slots__}
+    # numpy/pandas scalars from yfinance frames expose .item()
+    item = getattr(obj, "item", None)
+    if callable(item):
+        return _finite(item())
+    return str(obj)
+
+
+def _finite(v: Any) -> Any:
+    # NaN/inf (e.g. a missing P/E from yfinance) are not valid JSON; emit null like orjson does
+    if isinstance(v, float) and not math.isfinite(v):
+        return None
+    return v
+
+
+def to_builtin(obj: Any) -> Any:
+    """Recursively convert records (and containers of them) to plain dicts/lists and Python scalars."""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    if isinstance(obj, dict):
+        return {k: to_builtin(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_builtin(v) for v in obj]
+    if obj is None or isinstance(obj, (str, int, float)):
+        return _finite(obj)
+    # numpy/pandas scalars from yfinance frames expose .item()
+    item = getattr(obj, "item", None)
+    if callable(item):
+        return _finite(item())
+    return obj
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize records to JSON. With orjson installed, slotted dataclasses are encoded
+    directly from their fields without building intermediate dicts.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+    return json.dumps(
+        to_builtin(obj), indent=2 if indent else None, ensure_ascii=False, allow_nan=False, default=_default
+    )
+
+
+def dumps_msgpack(obj: Any) -> bytes:
+    """Serialize records to MessagePack, with NaN/inf as nil to match dumps()."""
+    if msgpack is None:
+        raise ImportError("msgpack is not installed (pip install msgpack)")
+    return msgpack.packb(to_builtin(obj), default=_default, use_bin_type=True)
@@ -0,0 +1,262 @@
+import heapq
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .agents.filings_agent import FilingsAgent
+from .agents.fundamentals_agent import FundamentalsAgent
+from .agents.news_agent import NewsAgent
+from .utils.ollama_client import OllamaClient
+
+JobKey = Tuple[str, str]  # (ticker, agent)
+
+
+@dataclass
+class RefreshPolicy:
+    """How often an agent's data goes stale and which upstream source it hits."""
+
+    interval: float  # seconds until a result is considered stale
+    source: str
+    cost: float = 1.0  # upstream requests made per refresh, charged against the source budget
+    retry: float = 60.0  # first retry delay after a failed refresh; doubles per failure, capped at interval
+
+
+# Quotes move fast, news moderately, filings change at most daily.
+DEFAULT_POLICIES: Dict[str, RefreshPolicy] = {
+    # get_info, fast_info, financials and cashflow
+    "fundamentals": RefreshPolicy(interval=5 * 60, source="yahoo", cost=4),
+    "news": RefreshPolicy(interval=30 * 60, source="google_news"),
+    # Cost is derived from filings_limit, see WatchlistScheduler.request_cost
+    "filings": RefreshPolicy(interval=24 * 60 * 60, source="sec"),
+}
+
+# Requests per minute allowed against each upstream source.
+DEFAULT_SOURCE_BUDGETS: Dict[str, float] = {
+    "yahoo": 30.0,
+    "google_news": 20.0,
+    "sec": 10.0,
+}
+
+
+class TokenBucket:
+    """
+    Simple refilling budget: `capacity` units per `per` seconds.
+    Thread-safe so the LLM budget can be charged from agent callbacks.
+    """
+
+    def __init__(self, capacity: float, per: float = 60.0, clock: Callable[[], float] = time.monotonic) -> None:
+        if capacity <= 0:
+            raise ValueError(f"budget must be positive, got {capacity}")
+        self.capacity = float(capacity)
+        self.rate = self.capacity / per
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self, amount: float = 1.0) -> bool:
+        # Amounts above capacity could never be granted; fail instead of waiting forever
+        if amount > self.capacity:
+            return False
+        with self._lock:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return True
+            return False
+
+    def wait_time(self, amount: float = 1.0) -> float:
+        if amount > self.capacity:
+            raise ValueError(f"amount {amount} exceeds bucket capacity {self.capacity}")
+        with self._lock:
+            self._refill()
+            if self.tokens >= amount:
+                return 0.0
+            return (amount - self.tokens) / self.rate
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, Mapping) and bool(result.get("error"))
+
+
+def estimate_tokens(text: str) -> int:
+    # Rough heuristic (~4 chars per token) plus headroom for the prompt and response
+    return len(text) // 4 + 128
+
+
+class WatchlistScheduler:
+    """
+    Keeps a watchlist fresh by refreshing (ticker, agent) jobs in staleness order.
+
+    Jobs sit in a min-heap keyed by the time they go stale under their agent's
+    RefreshPolicy. A due job only runs if its source still has rate budget;
+    otherwise it is pushed back until the source refills. A failed refresh keeps
+    the previous result and is retried with exponential backoff. LLM summaries are
+    charged against a global tokens-per-minute budget and skipped when it is
+    exhausted, leaving the agents' extractive summaries in place.
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        agents: Iterable[str] = ("fundamentals", "news", "filings"),
+        policies: Optional[Dict[str, RefreshPolicy]] = None,
+        source_budgets: Optional[Dict[str, float]] = None,
+        llm_tokens_per_minute: float = 0.0,
+        ollama_model: str = "mistral:latest",
+        ollama_url: str = "http://localhost:11434",
+        days: int = 7,
+        filings_limit: int = 2,
+        on_result: Optional[Callable[[str, str, Any], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.policies = dict(DEFAULT_POLICIES)
+        if policies:
+            self.policies.update(policies)
+        budgets = dict(DEFAULT_SOURCE_BUDGETS)
+        if source_budgets:
+            budgets.update(source_budgets)
+        self.clock = clock
+        self.buckets = {src: TokenBucket(rpm, clock=clock) for src, rpm in budgets.items()}
+        self.llm_budget = TokenBucket(llm_tokens_per_minute, clock=clock) if llm_tokens_per_minute > 0 else None
+        self.ollama_model = ollama_model
+        self.ollama_url = ollama_url
+        self.days = days
+        self.filings_limit = filings_limit
+        self.on_result = on_result
+
+        self.fundamentals = FundamentalsAgent()
+        self.news = NewsAgent()
+        self.filings = FilingsAgent()
+        self._client = OllamaClient(base_url=ollama_url) if self.llm_budget else None
+
+        self.results: Dict[JobKey, Any] = {}
+        self.last_run: Dict[JobKey, float] = {}
+        self.failures: Dict[JobKey, int] = {}
+        self.skipped_summaries = 0
+        self._heap: List[Tuple[float, int, str, str]] = []
+        self._seq = 0
+        now = clock()
+        agents = list(agents)
+        for agent in agents:
+            if agent not in self.policies:
+                raise ValueError(f"no refresh policy for agent: {agent}")
+            bucket = self.buckets.get(self.policies[agent].source)
+            cost = self.request_cost(agent)
+            if bucket is not None and cost > bucket.capacity:
+                raise ValueError(
+                    f"{agent} needs {cost} requests per refresh but the "
+                    f"{self.policies[agent].source} budget is {bucket.capacity}/min"
+                )
+        for ticker in tickers:
+            for agent in agents:
+                # Never-fetched data is maximally stale: schedule it immediately
+                self._push(now, ticker.upper(), agent)
+
+    def _push(self, due: float, ticker: str, agent: str) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, ticker, agent))
+
+    def staleness(self, ticker: str, agent: str) -> float:
+        """Age of the cached result as a fraction of its refresh interval (inf if never fetched)."""
+        last = self.last_run.get((ticker.upper(), agent))
+        if last is None:
+            return float("inf")
+        return (self.clock() - last) / self.policies[agent].interval
+
+    def request_cost(self, agent: str) -> float:
+        """Upstream requests one refresh of `agent` makes against its source."""
+        if agent == "filings":
+            # EDGAR feed, then the index page and primary document of each filing
+            return 1 + 2 * self.filings_limit
+        return self.policies[agent].cost
+
+    def retry_delay(self, agent: str, failures: int) -> float:
+        policy = self.policies[agent]
+        return min(policy.interval, policy.retry * 2 ** (failures - 1))
+
+    def next_due(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def _budgeted(self, call: Callable[[str], Optional[str]]) -> Optional[Callable[[str], Optional[str]]]:
+        """Wrap an LLM call so each invocation is charged against the tokens-per-minute budget."""
+        if self._client is None or self.llm_budget is None:
+            return None
+        budget = self.llm_budget
+
+        def summarize(text: str) -> Optional[str]:
+            if not budget.try_take(estimate_tokens(text)):
+                # Over budget: returning None keeps the extractive summary
+                self.skipped_summaries += 1
+                return None
+            return call(text)
+
+        return summarize
+
+    def _run_job(self, ticker: str, agent: str) -> Any:
+        if agent == "fundamentals":
+            return self.fundamentals.fetch(ticker)
+        if agent == "news":
+            fundamentals = self.results.get((ticker, "fundamentals")) or {}
+            company_name = fundamentals.get("identity", {}).get("name")
+            summarizer = self._budgeted(lambda text: self._client.summarize(text, model=self.ollama_model))
+            return self.news.fetch(ticker, company_name=company_name, days=self.days, summarizer=summarizer)
+        if agent == "filings":
+            return self.filings.fetch(
+                ticker,
+                limit=self.filings_limit,
+                summarizer=self._budgeted(lambda prompt: self._client.generate(prompt, model=self.ollama_model)),
+            )
+        raise ValueError(f"unknown agent: {agent}")
+
+    def run_pending(self) -> int:
+        """Run every job that is currently due and has source budget. Returns the number run."""
+        ran = 0
+        deferred: List[Tuple[float, str, str]] = []
+        while self._heap and self._heap[0][0] <= self.clock():
+            _, _, ticker, agent = heapq.heappop(self._heap)
+            policy = self.policies[agent]
+            bucket = self.buckets.get(policy.source)
+            cost = self.request_cost(agent)
+            if bucket is not None and not bucket.try_take(cost):
+                deferred.append((self.clock() + bucket.wait_time(cost), ticker, agent))
+                continue
+            try:
+                result = self._run_job(ticker, agent)
+            except Exception as e:
+                result = {"error": str(e)}
+            now = self.clock()
+            key = (ticker, agent)
+            if _is_error(result):
+                # Keep the last good result and its timestamp; retry sooner than a full interval
+                self.failures[key] = self.failures.get(key, 0) + 1
+                self._push(now + self.retry_delay(agent, self.failures[key]), ticker, agent)
+            else:
+                self.failures.pop(key, None)
+                self.results[key] = result
+                self.last_run[key] = now
+                self._push(now + policy.interval, ticker, agent)
+            ran += 1
+            if self.on_result:
+                try:
+                    self.on_result(ticker, agent, result)
+                except Exception:
+                    pass
+        for due, ticker, agent in deferred:
+            self._push(due, ticker, agent)
+        return ran
+
+    def run_forever(self, max_sleep: float = 60.0, stop: Optional[threading.Event] = None) -> None:
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.run_pending()
+            due = self.next_due()
+            delay = max_sleep if due is None else max(0.0, min(max_sleep, due - self.clock()))
+            stop.wait(delay)
@@ -1,5 +1,7 @@
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Tuple
+from typing import Any, List, Mapping, Tuple
+
+from ..records import NewsCluster
 
 
 def _norm(s: str) -> str:
@@ -10,12 +12,12 @@ def similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, _norm(a), _norm(b)).ratio()
 
 
-def cluster_news(items: List[Dict[str, Any]], title_key: str = "title", threshold: float = 0.82) -> List[Dict[str, Any]]:
+def cluster_news(items: List[Mapping[str, Any]], title_key: str = "title", threshold: float = 0.82) -> List[NewsCluster]:
     """
     Very lightweight clustering/deduplication: groups items whose titles are highly similar.
-    Returns a list of cluster dicts with 'title', 'items' members. Title is the first item's title.
+    Returns a list of NewsCluster records with 'title', 'size' and 'items'; 'summary' is left empty.
     """
-    clusters: List[Tuple[str, List[Dict[str, Any]]]] = []  # (rep_title, items)
+    clusters: List[Tuple[str, List[Mapping[str, Any]]]] = []  # (rep_title, items)
 
     for it in items:
         t = (it.get(title_key) or "").strip()
@@ -33,15 +35,12 @@ def cluster_news(items: List[Dict[str, Any]], title_key: str = "title", threshol
             clusters.append((t, [it]))
 
     # Build output with representative title and aggregated fields
-    out: List[Dict[str, Any]] = []
+    out: List[NewsCluster] = []
     for rep, members in clusters:
         # Prefer the longest title as representative
         if members:
             rep_title = max((m.get(title_key) or "" for m in members), key=len, default=rep)
         else:
             rep_title = rep
-        out.append({
-            "title": rep_title or rep,
-            "items": members,
-        })
+        out.append(NewsCluster(title=rep_title or rep, size=len(members), summary=None, items=members))
     return out
@@ -0,0 +1,137 @@
+import html
+import io
+import re
+from email.utils import parsedate_to_datetime
+from datetime import timezone
+from typing import List, NamedTuple, Optional
+
+from lxml import etree
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+    )
+}
+_UTC_ZONES = frozenset(("GMT", "UT", "UTC", "Z", "+0000", "-0000"))
+
+
+class FeedItem(NamedTuple):
+    title: Optional[str]
+    link: Optional[str]
+    source: Optional[str]
+    published: Optional[str]  # raw RFC 822 string from the feed
+    published_iso: Optional[str]
+    summary: Optional[str]
+
+
+class AtomEntry(NamedTuple):
+    title: Optional[str]
+    link: Optional[str]
+    updated: Optional[str]
+
+
+def clean_text(t: Optional[str]) -> Optional[str]:
+    """Strip markup/entities and collapse whitespace; skips the regex pass for plain text."""
+    if not t:
+        return t
+    if "&" in t:
+        t = html.unescape(t)
+    if "<" in t:
+        t = _TAG_RE.sub(" ", t)
+    return " ".join(t.split())
+
+
+def rfc822_to_iso(s: Optional[str]) -> Optional[str]:
+    """
+    Convert an RSS pubDate ("Mon, 20 Oct 2025 14:03:00 GMT") to a naive UTC ISO string
+    by slicing fields directly; only non-UTC offsets go through the stdlib parser.
+    """
+    if not s:
+        return None
+    parts = s.split()
+    if parts and parts[0].endswith(","):
+        parts = parts[1:]
+    try:
+        day, mon, year, hms = parts[0], parts[1], parts[2], parts[3]
+        zone = parts[4] if len(parts) > 4 else "GMT"
+        if zone in _UTC_ZONES and len(hms) == 8 and len(year) == 4:
+            d, hh, mm, ss = int(day), int(hms[:2]), int(hms[3:5]), int(hms[6:])
+            # Days past 28 (month-dependent) and out-of-range fields go through the stdlib parser
+            if 1 <= d <= 28 and hh < 24 and mm < 60 and ss < 60 and hms[2] == hms[5] == ":":
+                return f"{year}-{_MONTHS[mon[:3].title()]:02d}-{d:02d}T{hms}"
+    except (IndexError, KeyError, ValueError):
+        pass
+    try:
+        dt = parsedate_to_datetime(s)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat()
+
+
+def _text(el: Optional[etree._Element]) -> Optional[str]:
+    if el is None or el.text is None:
+        return None
+    return el.text.strip() or None
+
+
+def parse_rss(data: bytes, max_items: Optional[int] = None) -> List[FeedItem]:
+    """
+    Stream <item> elements out of an RSS 2.0 document, keeping only the fields NewsAgent uses.
+    Elements are cleared as they are consumed and parsing stops after `max_items`.
+    """
+    items: List[FeedItem] = []
+    if not data:
+        return items
+    context = etree.iterparse(io.BytesIO(data), events=("end",), tag="item", recover=True)
+    try:
+        for _, el in context:
+            published = _text(el.find("pubDate"))
+            items.append(
+                FeedItem(
+                    title=clean_text(_text(el.find("title"))),
+                    link=_text(el.find("link")),
+                    source=clean_text(_text(el.find("source"))),
+                    published=published,
+                    published_iso=rfc822_to_iso(published),
+                    summary=clean_text(_text(el.find("description"))),
+                )
+            )
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+            if max_items is not None and len(items) >= max_items:
+                break
+    except etree.XMLSyntaxError:
+        pass
+    return items
+
+
+def parse_atom(data: bytes, max_items: Optional[int] = None) -> List[AtomEntry]:
+    """Stream Atom <entry> elements (e.g. the SEC EDGAR company feed) into title/link/updated records."""
+    entries: List[AtomEntry] = []
+    if not data:
+        return entries
+    context = etree.iterparse(io.BytesIO(data), events=("end",), tag=ATOM_NS + "entry", recover=True)
+    try:
+        for _, el in context:
+            link = el.find(ATOM_NS + "link")
+            entries.append(
+                AtomEntry(
+                    title=_text(el.find(ATOM_NS + "title")),
+                    link=link.get("href") if link is not None else None,
+                    updated=_text(el.find(ATOM_NS + "updated")),
+                )
+            )
+            el.clear()
+            while el.getprevious() is not None:
+                del el.getparent()[0]
+            if max_items is not None and len(entries) >= max_items:
+                break
+    except etree.XMLSyntaxError:
+        pass
+    return entries
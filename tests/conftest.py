@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The package lives under src/ and is not installed; mirror PYTHONPATH=src from the README
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
@@ -0,0 +1,129 @@
+from typing import Any, Callable, List, Optional
+
+import pytest
+
+from agentic_ai_kata.records import Filings
+from agentic_ai_kata.scheduler import WatchlistScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubAgent:
+    """Records calls and returns queued results (the last one repeats)."""
+
+    def __init__(self, *results: Any) -> None:
+        self.results = list(results) or [{}]
+        self.calls: List[str] = []
+
+    def fetch(self, ticker: str, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append(ticker)
+        summarizer: Optional[Callable[[str], Optional[str]]] = kwargs.get("summarizer")
+        if summarizer is not None:
+            summarizer("x" * 400)
+        result = self.results[0] if len(self.results) == 1 else self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class StubClient:
+    def summarize(self, text: str, model: str) -> str:
+        return "llm"
+
+    def generate(self, prompt: str, model: str) -> str:
+        return "llm"
+
+
+def make_scheduler(clock: FakeClock, **kwargs: Any) -> WatchlistScheduler:
+    sched = WatchlistScheduler(clock=clock, **kwargs)
+    sched.fundamentals = StubAgent({"identity": {"name": "Apple"}})
+    sched.news = StubAgent([])
+    sched.filings = StubAgent(Filings(ticker="AAPL", filings=[], error=None))
+    return sched
+
+
+def test_initial_jobs_run_immediately() -> None:
+    clock = FakeClock()
+    sched = make_scheduler(clock, tickers=["aapl", "msft"])
+    assert sched.run_pending() == 6
+    assert sched.fundamentals.calls == ["AAPL", "MSFT"]
+    assert sched.staleness("aapl", "news") == 0.0
+    assert sched.run_pending() == 0
+
+
+def test_job_due_again_after_interval() -> None:
+    clock = FakeClock()
+    sched = make_scheduler(clock, tickers=["aapl"], agents=["fundamentals"])
+    sched.run_pending()
+    interval = sched.policies["fundamentals"].interval
+    assert sched.next_due() == interval
+
+    clock.now = interval - 1
+    assert sched.run_pending() == 0
+    clock.now = interval
+    assert sched.run_pending() == 1
+    assert sched.fundamentals.calls == ["AAPL", "AAPL"]
+
+
+def test_job_deferred_when_source_budget_empty() -> None:
+    clock = FakeClock()
+    # Default filings cost is 1 + 2 * 2 = 5 SEC requests; a 10/min budget fits two refreshes
+    sched = make_scheduler(clock, tickers=["a", "b", "c"], agents=["filings"], source_budgets={"sec": 10})
+    assert sched.run_pending() == 2
+    assert sched.filings.calls == ["A", "B"]
+    # Five tokens refill in 30s at 10/min
+    assert sched.next_due() == pytest.approx(30.0)
+
+    clock.now = 30.0
+    assert sched.run_pending() == 1
+    assert sched.filings.calls == ["A", "B", "C"]
+
+
+def test_cost_above_budget_rejected() -> None:
+    with pytest.raises(ValueError):
+        WatchlistScheduler(["a"], agents=["filings"], filings_limit=5, source_budgets={"sec": 10})
+    with pytest.raises(ValueError):
+        WatchlistScheduler(["a"], source_budgets={"sec": 0})
+
+
+def test_skipped_summaries_when_llm_budget_exhausted() -> None:
+    clock = FakeClock()
+    # Each stubbed summary costs 400 // 4 + 128 = 228 tokens; 300/min allows one
+    sched = make_scheduler(clock, tickers=["a", "b"], agents=["news"], llm_tokens_per_minute=300)
+    sched._client = StubClient()
+    sched.run_pending()
+    assert sched.skipped_summaries == 1
+
+
+@pytest.mark.parametrize("failure", [RuntimeError("429"), Filings(ticker="AAPL", filings=[], error="no_feed")])
+def test_failed_refresh_keeps_result_and_backs_off(failure: Any) -> None:
+    clock = FakeClock()
+    sched = make_scheduler(clock, tickers=["aapl"], agents=["filings"])
+    good = Filings(ticker="AAPL", filings=[], error=None)
+    sched.filings = StubAgent(good, failure, failure, good)
+    interval = sched.policies["filings"].interval
+    retry = sched.policies["filings"].retry
+
+    sched.run_pending()
+    clock.now = interval
+    sched.run_pending()
+    assert sched.results[("AAPL", "filings")] is good
+    assert sched.last_run[("AAPL", "filings")] == 0.0
+    assert sched.staleness("aapl", "filings") == 1.0
+    assert sched.next_due() == interval + retry
+
+    clock.now = interval + retry
+    sched.run_pending()
+    assert sched.next_due() == clock.now + 2 * retry
+
+    clock.now = sched.next_due()
+    sched.run_pending()
+    assert sched.last_run[("AAPL", "filings")] == clock.now
+    assert sched.next_due() == clock.now + interval
+    assert ("AAPL", "filings") not in sched.failures